@@ -13,6 +13,7 @@ import numpy as np
 import zmq
 
 from brainbot_core.config import CameraStreamConfig, CameraStreamSourceConfig
+from brainbot_core.transport import shared_context
 
 
 @dataclass
@@ -112,7 +113,7 @@ def _get_nested(payload: Any, path: str) -> Any:
 class CameraStreamer:
     def __init__(self, config: CameraStreamConfig):
         self.config = config
-        self._context = zmq.Context.instance()
+        self._context = shared_context()
         self._socket = self._context.socket(zmq.PUB)
         self._socket.bind(f"tcp://{config.host}:{config.port}")
         self._queue: queue.Queue[tuple[bytes, bytes]] = queue.Queue()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 import io
 import os
 import re
@@ -14,6 +15,9 @@ from lerobot.robots.config import RobotConfig
 from lerobot.teleoperators.config import TeleoperatorConfig
 from lerobot.scripts.lerobot_record import DatasetRecordConfig
 
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 @dataclass(slots=True)
 class NetworkConfig:
     host: str = "127.0.0.1"
@@ -139,10 +143,11 @@ class ServerRuntimeConfig:
 def load_edge_config(path: Path) -> EdgeControlConfig:
     raw = _load_yaml(path)
     base_dir = path.parent
+    yaml_cache: dict[str, dict[str, Any]] = {}
     robot_raw = raw.pop("robot", None)
     robot_path = raw.pop("robot_config_path", None)
     if robot_path:
-        robot_external = _load_robot_config_from_path(robot_path, base_dir)
+        robot_external = _load_robot_config_from_path(robot_path, base_dir, yaml_cache)
         if robot_raw:
             merged = dict(robot_external)
             merged.update(robot_raw)
@@ -180,6 +185,7 @@ def load_edge_config(path: Path) -> EdgeControlConfig:
 def load_server_config(path: Path) -> ServerRuntimeConfig:
     raw = _load_yaml(path)
     base_dir = path.parent
+    yaml_cache: dict[str, dict[str, Any]] = {}
 
     teleops_data = raw.pop("teleops", None)
     teleop_single = raw.pop("teleop", None)
@@ -187,9 +193,9 @@ def load_server_config(path: Path) -> ServerRuntimeConfig:
     teleop_cfgs: dict[str, TeleopEndpointConfig] = {}
     if teleops_data:
         for name, cfg in teleops_data.items():
-            teleop_cfgs[name] = _make_teleop_endpoint(name, cfg, base_dir)
+            teleop_cfgs[name] = _make_teleop_endpoint(name, cfg, base_dir, yaml_cache)
     elif teleop_single is not None:
-        teleop_cfgs["default"] = _make_teleop_endpoint("default", teleop_single, base_dir)
+        teleop_cfgs["default"] = _make_teleop_endpoint("default", teleop_single, base_dir, yaml_cache)
 
     default_mode = raw.pop("default_mode", None)
     if default_mode is None and teleop_cfgs:
@@ -204,7 +210,7 @@ def load_server_config(path: Path) -> ServerRuntimeConfig:
     camera_stream_data = raw.pop("camera_stream", None)
     camera_stream_cfg = _load_camera_stream_config(camera_stream_data) if camera_stream_data else None
     data_raw = raw.pop("data", None)
-    data_cfg = _load_data_mode_config(data_raw, base_dir=base_dir) if data_raw else None
+    data_cfg = _load_data_mode_config(data_raw, base_dir=base_dir, yaml_cache=yaml_cache) if data_raw else None
 
     return ServerRuntimeConfig(
         teleops=teleop_cfgs,
@@ -219,8 +225,19 @@ def load_server_config(path: Path) -> ServerRuntimeConfig:
 
 
 def _load_yaml(path: Path) -> dict[str, Any]:
-    with path.open("r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle) or {}
+    return yaml.load(path.read_bytes(), Loader=_SafeLoader) or {}
+
+
+def _load_yaml_cached(path: Path, yaml_cache: dict[str, dict[str, Any]] | None) -> dict[str, Any]:
+    """Parse each referenced file once per top-level config load; callers get a private copy."""
+    if yaml_cache is None:
+        return _load_yaml(path)
+    key = str(path.resolve())
+    data = yaml_cache.get(key)
+    if data is None:
+        data = _load_yaml(path)
+        yaml_cache[key] = data
+    return copy.deepcopy(data)
 
 
 def _load_camera_stream_config(data: Mapping[str, Any]) -> CameraStreamConfig:
@@ -289,17 +306,26 @@ def _load_draccus_config(data: Mapping[str, Any], target_cls: type) -> Any:
                     except ModuleNotFoundError:
                         pass
     buffer = io.StringIO()
-    yaml.safe_dump(dict(data), buffer)
+    payload = data if type(data) is dict else dict(data)
+    yaml.dump(payload, buffer, Dumper=_SafeDumper)
     buffer.seek(0)
     with draccus.config_type("yaml"):
         return draccus.load(target_cls, buffer)
 
 
-def _load_data_mode_config(data: Mapping[str, Any] | str | Path, base_dir: Path | None = None) -> DataModeConfig:
+def _load_data_mode_config(
+    data: Mapping[str, Any] | str | Path,
+    base_dir: Path | None = None,
+    yaml_cache: dict[str, dict[str, Any]] | None = None,
+) -> DataModeConfig:
     if isinstance(data, (str, Path)):
         external_path = _resolve_config_path(data, base_dir)
-        external_data = _load_yaml(external_path)
-        return _load_data_mode_config(external_data.get("data", external_data), base_dir=external_path.parent)
+        external_data = _load_yaml_cached(external_path, yaml_cache)
+        return _load_data_mode_config(
+            external_data.get("data", external_data),
+            base_dir=external_path.parent,
+            yaml_cache=yaml_cache,
+        )
     if not isinstance(data, Mapping):
         raise ValueError("Data mode configuration must be a mapping")
 
@@ -307,7 +333,7 @@ def _load_data_mode_config(data: Mapping[str, Any] | str | Path, base_dir: Path
     config_path = local.pop("config_path", None)
     if config_path:
         external_path = _resolve_config_path(config_path, base_dir)
-        external_data = _load_yaml(external_path)
+        external_data = _load_yaml_cached(external_path, yaml_cache)
         merged = dict(external_data.get("data", external_data))
         merged.update(local)
         local = merged
@@ -316,7 +342,7 @@ def _load_data_mode_config(data: Mapping[str, Any] | str | Path, base_dir: Path
     robot_raw = local.pop("robot", None)
     robot_path = local.pop("robot_config_path", None)
     if robot_path:
-        robot_external = _load_robot_config_from_path(robot_path, base_dir)
+        robot_external = _load_robot_config_from_path(robot_path, base_dir, yaml_cache)
         if robot_raw:
             merged_robot = dict(robot_external)
             merged_robot.update(robot_raw)
@@ -334,7 +360,7 @@ def _load_data_mode_config(data: Mapping[str, Any] | str | Path, base_dir: Path
     teleop_cfg: TeleopEndpointConfig | None = None
     if teleop_raw:
         if isinstance(teleop_raw, Mapping) and teleop_raw.get("mode"):
-            teleop_cfg = _make_teleop_endpoint("data", teleop_raw, base_dir)
+            teleop_cfg = _make_teleop_endpoint("data", teleop_raw, base_dir, yaml_cache)
         else:
             local_cfg = _load_draccus_config(teleop_raw, TeleoperatorConfig)
             teleop_cfg = TeleopEndpointConfig(mode="local", local=local_cfg)
@@ -375,9 +401,13 @@ def _expand_env_var(value: str | None) -> str | None:
     return expanded
 
 
-def _load_robot_config_from_path(value: str | Path, base_dir: Path | None) -> Mapping[str, Any]:
+def _load_robot_config_from_path(
+    value: str | Path,
+    base_dir: Path | None,
+    yaml_cache: dict[str, dict[str, Any]] | None = None,
+) -> Mapping[str, Any]:
     path_obj = _resolve_config_path(value, base_dir)
-    data = _load_yaml(path_obj)
+    data = _load_yaml_cached(path_obj, yaml_cache)
     robot_data = data.get("robot", data)
     if not isinstance(robot_data, Mapping):
         raise ValueError(f"Robot config at '{path_obj}' must contain a mapping under 'robot'")
@@ -389,6 +419,7 @@ def _resolve_remote_endpoint(
     port: int | str | None,
     config_path: str | Path | None,
     base_dir: Path | None,
+    yaml_cache: dict[str, dict[str, Any]] | None = None,
 ) -> tuple[str, int, str | None]:
     resolved_path: str | None = None
     resolved_host = _expand_env_var(host)
@@ -396,7 +427,7 @@ def _resolve_remote_endpoint(
     if config_path:
         path_obj = _resolve_config_path(config_path, base_dir)
         resolved_path = str(path_obj)
-        config_data = _load_yaml(path_obj) or {}
+        config_data = _load_yaml_cached(path_obj, yaml_cache) or {}
         network_cfg = config_data.get("network", {})
         if isinstance(network_cfg, Mapping):
             if resolved_port is None and network_cfg.get("port") is not None:
@@ -417,7 +448,12 @@ def _resolve_remote_endpoint(
     return str(resolved_host), resolved_port, resolved_path
 
 
-def _make_teleop_endpoint(name: str, cfg: Mapping[str, Any], base_dir: Path | None = None) -> TeleopEndpointConfig:
+def _make_teleop_endpoint(
+    name: str,
+    cfg: Mapping[str, Any],
+    base_dir: Path | None = None,
+    yaml_cache: dict[str, dict[str, Any]] | None = None,
+) -> TeleopEndpointConfig:
     mode = cfg.get("mode")
     if mode == "remote":
         manager_cfg = None
@@ -437,7 +473,9 @@ def _make_teleop_endpoint(name: str, cfg: Mapping[str, Any], base_dir: Path | No
         config_path_raw = cfg.get("config")
         if host_raw is None and manager_cfg and manager_cfg.host:
             host_raw = manager_cfg.host
-        host, port, resolved_cfg_path = _resolve_remote_endpoint(host_raw, port_raw, config_path_raw, base_dir)
+        host, port, resolved_cfg_path = _resolve_remote_endpoint(
+            host_raw, port_raw, config_path_raw, base_dir, yaml_cache
+        )
         if manager_cfg and manager_cfg.host is None:
             manager_cfg.host = host
         return TeleopEndpointConfig(
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import io
+import threading
 import time
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Literal, Mapping
 
@@ -12,11 +13,13 @@ import numpy as np
 
 MessageType = Literal["observation", "action", "status"]
 
+_now_ns = time.time_ns
+
 
 @dataclass(slots=True)
 class ObservationMessage:
     payload: Mapping[str, Any]
-    timestamp_ns: int = field(default_factory=lambda: time.time_ns())
+    timestamp_ns: int = field(default_factory=_now_ns)
     metadata: Mapping[str, Any] | None = None
     version: int = 1
 
@@ -24,7 +27,7 @@ class ObservationMessage:
 @dataclass(slots=True)
 class ActionMessage:
     actions: Mapping[str, float]
-    timestamp_ns: int = field(default_factory=lambda: time.time_ns())
+    timestamp_ns: int = field(default_factory=_now_ns)
     metadata: Mapping[str, Any] | None = None
     version: int = 1
 
@@ -32,13 +35,32 @@ class ActionMessage:
 @dataclass(slots=True)
 class StatusMessage:
     status: str
-    timestamp_ns: int = field(default_factory=lambda: time.time_ns())
+    timestamp_ns: int = field(default_factory=_now_ns)
     metadata: Mapping[str, Any] | None = None
     version: int = 1
 
 
 _NDARRAY_FLAG = "__ndarray__"
 _NDARRAY_BUFFER = "npy"
+_PRIMITIVE_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+
+
+def _needs_normalize(value: Any) -> bool:
+    """Return True when ``_normalize`` would produce something other than ``value``."""
+    value_type = type(value)
+    if value_type in _PRIMITIVE_TYPES or value_type is np.ndarray:
+        return False
+    if value_type is dict:
+        for key, item in value.items():
+            if type(key) is not str or _needs_normalize(item):
+                return True
+        return False
+    if value_type is list:
+        for item in value:
+            if _needs_normalize(item):
+                return True
+        return False
+    return True
 
 
 def _normalize(value: Any) -> Any:
@@ -47,7 +69,11 @@ def _normalize(value: Any) -> Any:
     if isinstance(value, (list, tuple)):
         return [_normalize(v) for v in value]
     if isinstance(value, (set, frozenset)):
-        return [_normalize(v) for v in sorted(value, key=lambda x: str(x))]
+        try:
+            items = sorted(value)
+        except TypeError:
+            items = sorted(value, key=str)
+        return [_normalize(v) for v in items]
     if hasattr(value, "__fspath__"):
         return str(value)
     if isinstance(value, bytearray):
@@ -79,14 +105,32 @@ def _msgpack_decode(obj: Any) -> Any:
     return obj
 
 
+def _normalize_field(value: Any) -> Any:
+    return _normalize(value) if _needs_normalize(value) else value
+
+
+_MESSAGE_TYPES: dict[type, MessageType] = {
+    ObservationMessage: "observation",
+    ActionMessage: "action",
+    StatusMessage: "status",
+}
+
+_PACKER_LOCAL = threading.local()
+
+
+def _thread_packer() -> msgpack.Packer:
+    # Packer keeps its output buffer between calls; autoreset clears it after each pack.
+    packer = getattr(_PACKER_LOCAL, "packer", None)
+    if packer is None:
+        packer = msgpack.Packer(use_bin_type=True, default=_msgpack_encode)
+        _PACKER_LOCAL.packer = packer
+    return packer
+
+
 class MessageSerializer:
     @staticmethod
     def dump(message: ObservationMessage | ActionMessage | StatusMessage) -> bytes:
-        return msgpack.packb(
-            MessageSerializer.to_dict(message),
-            use_bin_type=True,
-            default=_msgpack_encode,
-        )
+        return _thread_packer().pack(MessageSerializer.to_dict(message))
 
     @staticmethod
     def load(payload: bytes) -> ObservationMessage | ActionMessage | StatusMessage:
@@ -95,14 +139,21 @@ class MessageSerializer:
 
     @staticmethod
     def to_dict(message: ObservationMessage | ActionMessage | StatusMessage) -> dict[str, Any]:
-        data = asdict(message)
-        data["message_type"] = message.__class__.__name__.removesuffix("Message").lower()
-        if "payload" in data:
-            data["payload"] = _normalize(data["payload"])
-        if "actions" in data:
-            data["actions"] = _normalize(data["actions"])
-        if "metadata" in data:
-            data["metadata"] = _normalize(data["metadata"])
+        # Built field by field: dataclasses.asdict would deep-copy payloads (including ndarrays)
+        # that are serialized immediately afterwards.
+        if isinstance(message, ObservationMessage):
+            data: dict[str, Any] = {"payload": _normalize_field(message.payload)}
+        elif isinstance(message, ActionMessage):
+            data = {"actions": _normalize_field(message.actions)}
+        else:
+            data = {"status": message.status}
+        data["timestamp_ns"] = message.timestamp_ns
+        data["metadata"] = _normalize_field(message.metadata)
+        data["version"] = message.version
+        message_type = _MESSAGE_TYPES.get(type(message))
+        if message_type is None:
+            message_type = type(message).__name__.removesuffix("Message").lower()  # type: ignore[assignment]
+        data["message_type"] = message_type
         return data
 
     @staticmethod
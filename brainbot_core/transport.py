@@ -9,8 +9,12 @@
 
 from __future__ import annotations
 
+import functools
 import io
 import json
+import math
+import os
+import traceback
 from dataclasses import dataclass
 from typing import Any, Callable
 from contextlib import contextmanager
@@ -33,12 +37,7 @@ class ModalityConfig:
     modality_keys: list[str]
 
     def model_dump_json(self) -> str:
-        return json.dumps(
-            {
-                "delta_indices": list(self.delta_indices),
-                "modality_keys": list(self.modality_keys),
-            }
-        )
+        return _modality_config_json(tuple(self.delta_indices), tuple(self.modality_keys))
 
     @classmethod
     def from_json(cls, payload: str) -> "ModalityConfig":
@@ -49,13 +48,111 @@ class ModalityConfig:
         )
 
 
+def shared_context() -> zmq.Context:
+    """Process-wide ZeroMQ context; never terminate it from a socket owner.
+
+    ``BRAINBOT_ZMQ_IO_THREADS`` sizes the I/O thread pool when the context is
+    first created, which helps servers that move camera frames.
+    """
+    raw = os.environ.get("BRAINBOT_ZMQ_IO_THREADS", "")
+    try:
+        io_threads = max(int(raw), 1) if raw else 1
+    except ValueError:
+        io_threads = 1
+    return zmq.Context.instance(io_threads=io_threads)
+
+
+def _configure_rpc_socket(sock: zmq.Socket) -> None:
+    sock.setsockopt(zmq.LINGER, 0)
+    # Detect peers that vanished (robot power loss, Wi-Fi drop) instead of
+    # waiting on a half-open TCP connection. libzmq already disables Nagle.
+    sock.setsockopt(zmq.TCP_KEEPALIVE, 1)
+    sock.setsockopt(zmq.TCP_KEEPALIVE_IDLE, 30)
+
+
+@functools.lru_cache(maxsize=64)
+def _modality_config_json(delta_indices: tuple[int, ...], modality_keys: tuple[str, ...]) -> str:
+    # Keyed on the field contents, so mutating the lists never serves a stale payload.
+    return json.dumps(
+        {
+            "delta_indices": list(delta_indices),
+            "modality_keys": list(modality_keys),
+        }
+    )
+
+
+_NPY_MAGIC_PREFIX = b"\x93NUMPY"
+
+
+@functools.lru_cache(maxsize=256)
+def _npy_header(dtype: np.dtype, fortran_order: bool, shape: tuple[int, ...]) -> bytes:
+    header = {
+        "descr": np.lib.format.dtype_to_descr(dtype),
+        "fortran_order": fortran_order,
+        "shape": shape,
+    }
+    buffer = io.BytesIO()
+    np.lib.format.write_array_header_1_0(buffer, header)
+    return buffer.getvalue()
+
+
+def _ndarray_to_npy(array: np.ndarray) -> bytes:
+    """Encode ``array`` in the NPY format without staging it in a BytesIO."""
+    if array.dtype.hasobject:
+        raise ValueError("Object arrays cannot be serialized without pickle")
+    fortran_order = bool(array.flags.f_contiguous and not array.flags.c_contiguous)
+    if not fortran_order and not array.flags.c_contiguous:
+        array = np.ascontiguousarray(array)
+    header = _npy_header(array.dtype, fortran_order, tuple(array.shape))
+    body = array.T if fortran_order else array
+    try:
+        return b"".join((header, body))
+    except (TypeError, ValueError, BufferError):
+        # dtypes without buffer-protocol support (e.g. datetime64)
+        return header + body.tobytes()
+
+
+def _npy_to_ndarray(data: bytes) -> np.ndarray:
+    """Decode an NPY blob as a read-only view over ``data`` instead of copying it."""
+    if not data.startswith(_NPY_MAGIC_PREFIX):
+        return np.load(io.BytesIO(data), allow_pickle=False)
+    stream = io.BytesIO(data)
+    major, _ = np.lib.format.read_magic(stream)
+    if major == 1:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(stream)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(stream)
+    if dtype.hasobject:
+        return np.load(io.BytesIO(data), allow_pickle=False)
+    count = math.prod(shape)
+    array = np.frombuffer(data, dtype=dtype, count=count, offset=stream.tell())
+    if fortran_order:
+        return array.reshape(shape[::-1]).T
+    return array.reshape(shape)
+
+
 class MsgSerializer:
     @staticmethod
     def to_bytes(data: dict) -> bytes:
         return msgpack.packb(data, default=MsgSerializer.encode_custom_classes)
 
     @staticmethod
-    def from_bytes(data: bytes) -> dict:
+    def new_packer() -> msgpack.Packer:
+        """Packer for :meth:`send`; reusing it keeps its internal buffer across calls."""
+        return msgpack.Packer(default=MsgSerializer.encode_custom_classes, autoreset=False)
+
+    @staticmethod
+    def send(socket: zmq.Socket, packer: msgpack.Packer, data: dict) -> None:
+        """Pack ``data`` into ``packer``'s buffer and send it without an intermediate bytes."""
+        try:
+            packer.pack(data)
+            with packer.getbuffer() as view:
+                socket.send(view)
+        finally:
+            packer.reset()
+
+    @staticmethod
+    def from_bytes(data: bytes | memoryview) -> dict:
         return msgpack.unpackb(data, object_hook=MsgSerializer.decode_custom_classes)
 
     @staticmethod
@@ -63,7 +160,7 @@ class MsgSerializer:
         if "__ModalityConfig_class__" in obj:
             return ModalityConfig.from_json(obj["as_json"])
         if "__ndarray_class__" in obj:
-            return np.load(io.BytesIO(obj["as_npy"]), allow_pickle=False)
+            return _npy_to_ndarray(obj["as_npy"])
         return obj
 
     @staticmethod
@@ -71,9 +168,7 @@ class MsgSerializer:
         if isinstance(obj, ModalityConfig):
             return {"__ModalityConfig_class__": True, "as_json": obj.model_dump_json()}
         if isinstance(obj, np.ndarray):
-            output = io.BytesIO()
-            np.save(output, obj, allow_pickle=False)
-            return {"__ndarray_class__": True, "as_npy": output.getvalue()}
+            return {"__ndarray_class__": True, "as_npy": _ndarray_to_npy(obj)}
         return obj
 
 
@@ -88,11 +183,13 @@ class BaseZMQServer:
 
     def __init__(self, host: str = "*", port: int = 5555, api_token: str | None = None):
         self.running = True
-        self.context = zmq.Context.instance()
+        self.context = shared_context()
         self.socket = self.context.socket(zmq.REP)
-        self.socket.setsockopt(zmq.LINGER, 0)
+        _configure_rpc_socket(self.socket)
         self.socket.bind(f"tcp://{host}:{port}")
         self._endpoints: dict[str, EndpointHandler] = {}
+        self._packer = MsgSerializer.new_packer()
+        self._poll_timeout_ms = 100
         self.api_token = api_token
 
         self.register_endpoint("ping", self._handle_ping, requires_input=False)
@@ -117,27 +214,34 @@ class BaseZMQServer:
         print(f"Server is ready and listening on {addr}")
         while self.running:
             try:
-                message = self.socket.recv()
-                request = MsgSerializer.from_bytes(message)
+                # Bounded poll so a cleared ``running`` flag is noticed without a request.
+                if not self.socket.poll(self._poll_timeout_ms, zmq.POLLIN):
+                    continue
+                # Requests carry camera frames; unpack straight from the zmq frame
+                # rather than copying the whole message into a bytes object first.
+                frame = self.socket.recv(copy=False)
+                request = MsgSerializer.from_bytes(frame.buffer)
 
                 if not self._validate_token(request):
-                    self.socket.send(
-                        MsgSerializer.to_bytes({"error": "Unauthorized: Invalid API token"})
+                    MsgSerializer.send(
+                        self.socket,
+                        self._packer,
+                        {"error": "Unauthorized: Invalid API token"},
                     )
                     continue
 
                 endpoint = request.get("endpoint", "get_action")
 
-                if endpoint not in self._endpoints:
+                handler = self._endpoints.get(endpoint)
+                if handler is None:
                     raise ValueError(f"Unknown endpoint: {endpoint}")
 
-                handler = self._endpoints[endpoint]
                 result = (
                     handler.handler(request.get("data", {}))
                     if handler.requires_input
                     else handler.handler()
                 )
-                self.socket.send(MsgSerializer.to_bytes(result))
+                MsgSerializer.send(self.socket, self._packer, result)
                 try:
                     self._post_send(endpoint, result)
                 except AttributeError:
@@ -148,11 +252,9 @@ class BaseZMQServer:
                 if not self.running:
                     break
                 print(f"Error in server: {exc}")
-                import traceback
-
-                print(traceback.format_exc())
+                traceback.print_exc()
                 try:
-                    self.socket.send(MsgSerializer.to_bytes({"error": str(exc)}))
+                    MsgSerializer.send(self.socket, self._packer, {"error": str(exc)})
                 except zmq.error.ZMQError:
                     break
 
@@ -176,11 +278,12 @@ class BaseZMQClient:
         timeout_ms: int = 15000,
         api_token: str | None = None,
     ):
-        self.context = zmq.Context.instance()
+        self.context = shared_context()
         self.host = host
         self.port = port
         self.timeout_ms = int(timeout_ms)
         self.api_token = api_token
+        self._packer = MsgSerializer.new_packer()
         self._init_socket()
 
     def _init_socket(self):
@@ -191,7 +294,7 @@ class BaseZMQClient:
             except Exception:
                 pass
         self.socket = self.context.socket(zmq.REQ)
-        self.socket.setsockopt(zmq.LINGER, 0)
+        _configure_rpc_socket(self.socket)
         self._apply_socket_timeouts(self.timeout_ms)
         self.socket.connect(f"tcp://{self.host}:{self.port}")
 
@@ -241,7 +344,7 @@ class BaseZMQClient:
 
         send_start = time.perf_counter()
         try:
-            self.socket.send(MsgSerializer.to_bytes(request))
+            MsgSerializer.send(self.socket, self._packer, request)
         except zmq.error.ZMQError:
             self._init_socket()
             raise
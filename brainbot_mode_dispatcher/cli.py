@@ -5,7 +5,7 @@ import queue
 import threading
 
 from .events import ModeEvent, ModeEventDispatcher, ModeEventListener
-from .commands import enqueue_mode_command
+from .commands import STOP, enqueue_mode_command, json_loads, run_dispatch_loop
 
 
 class CLIModeDispatcher(ModeEventDispatcher):
@@ -29,6 +29,8 @@ class CLIModeDispatcher(ModeEventDispatcher):
 
     def stop(self) -> None:
         self._stop_event.set()
+        if self._queue is not None:
+            self._queue.put(STOP)  # type: ignore[arg-type]
         thread = self._thread
         if thread and thread.is_alive():
             thread.join(timeout=0.1)
@@ -46,7 +48,7 @@ class CLIModeDispatcher(ModeEventDispatcher):
             if not raw:
                 continue
             try:
-                data = json.loads(raw)
+                data = json_loads(raw)
             except json.JSONDecodeError as exc:
                 print(f"[dispatcher] invalid JSON: {exc}")
                 continue
@@ -60,12 +62,7 @@ class CLIModeDispatcher(ModeEventDispatcher):
         listener = self._listener
         if queue_obj is None or listener is None:
             return
-        while not self._stop_event.is_set():
-            try:
-                event = queue_obj.get(timeout=0.1)
-            except queue.Empty:
-                continue
-            listener(event)
+        run_dispatch_loop(queue_obj, listener)
 
     def _handle_command(self, data: dict) -> None:
         queue_obj = self._queue
@@ -1,57 +1,107 @@
 from __future__ import annotations
 
+import json
 import queue
-from typing import Any, Mapping
+from typing import Any, Callable, Mapping
 
 from .events import (
     DataModeEvent,
     IdleModeEvent,
     InferenceModeEvent,
     ModeEvent,
+    ModeEventListener,
     ShutdownModeEvent,
     TeleopModeEvent,
 )
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
 
-def enqueue_mode_command(data: Mapping[str, Any], queue_obj: queue.Queue[ModeEvent]) -> bool:
-    """Translate a JSON-compatible dict into one or more mode events."""
-    dispatched = False
-    if "data" in data:
-        value = data["data"]
-        if isinstance(value, Mapping):
-            target = value.get("mode")
-            command = value.get("command")
-            alias = None
-            if target is not None:
-                alias = str(target) if target else "data"
-            elif command:
-                alias = "data"
-            if alias is not None:
-                queue_obj.put(TeleopModeEvent(alias=alias))
-                dispatched = True
-            if command:
-                queue_obj.put(DataModeEvent(command=str(command)))
-                dispatched = True
-        else:
-            if value in (None, ""):
-                queue_obj.put(TeleopModeEvent(alias="data"))
-            else:
-                queue_obj.put(TeleopModeEvent(alias="data"))
-                queue_obj.put(DataModeEvent(command=str(value)))
+# Shared by the CLI and socket dispatchers to decode command lines.
+json_loads = orjson.loads if orjson is not None else json.loads
+
+# Queued by a dispatcher's stop() so run_dispatch_loop can block without a timeout.
+STOP = object()
+
+
+def run_dispatch_loop(queue_obj: queue.Queue[ModeEvent], listener: ModeEventListener) -> None:
+    """Hand queued events to ``listener`` until :data:`STOP` is dequeued."""
+    while True:
+        events = [queue_obj.get()]
+        # Drain whatever else arrived so a burst is handled in one wakeup.
+        while True:
+            try:
+                events.append(queue_obj.get_nowait())
+            except queue.Empty:
+                break
+        for event in events:
+            if event is STOP:
+                return
+            listener(event)
+
+
+def _enqueue_data(value: Any, queue_obj: queue.Queue[ModeEvent]) -> bool:
+    if isinstance(value, Mapping):
+        dispatched = False
+        target = value.get("mode")
+        command = value.get("command")
+        alias = None
+        if target is not None:
+            alias = str(target) if target else "data"
+        elif command:
+            alias = "data"
+        if alias is not None:
+            queue_obj.put(TeleopModeEvent(alias=alias))
+            dispatched = True
+        if command:
+            queue_obj.put(DataModeEvent(command=str(command)))
             dispatched = True
         return dispatched
-    if "teleop" in data:
-        queue_obj.put(TeleopModeEvent(alias=str(data["teleop"])))
-        return True
-    if "infer" in data:
-        queue_obj.put(InferenceModeEvent(instruction=str(data["infer"]).strip()))
-        return True
-    if "idle" in data:
-        value = data["idle"]
-        queue_obj.put(IdleModeEvent(reason=str(value)) if value else IdleModeEvent())
-        return True
-    if "shutdown" in data:
-        value = data["shutdown"]
-        queue_obj.put(ShutdownModeEvent(reason=str(value)) if value else ShutdownModeEvent())
-        return True
+    queue_obj.put(TeleopModeEvent(alias="data"))
+    if value not in (None, ""):
+        queue_obj.put(DataModeEvent(command=str(value)))
+    return True
+
+
+def _enqueue_teleop(value: Any, queue_obj: queue.Queue[ModeEvent]) -> bool:
+    queue_obj.put(TeleopModeEvent(alias=str(value)))
+    return True
+
+
+def _enqueue_infer(value: Any, queue_obj: queue.Queue[ModeEvent]) -> bool:
+    queue_obj.put(InferenceModeEvent(instruction=str(value).strip()))
+    return True
+
+
+def _enqueue_idle(value: Any, queue_obj: queue.Queue[ModeEvent]) -> bool:
+    queue_obj.put(IdleModeEvent(reason=str(value)) if value else IdleModeEvent())
+    return True
+
+
+def _enqueue_shutdown(value: Any, queue_obj: queue.Queue[ModeEvent]) -> bool:
+    queue_obj.put(ShutdownModeEvent(reason=str(value)) if value else ShutdownModeEvent())
+    return True
+
+
+# Insertion order is the precedence used when a command carries several keys.
+_HANDLERS: dict[str, Callable[[Any, queue.Queue[ModeEvent]], bool]] = {
+    "data": _enqueue_data,
+    "teleop": _enqueue_teleop,
+    "infer": _enqueue_infer,
+    "idle": _enqueue_idle,
+    "shutdown": _enqueue_shutdown,
+}
+
+
+def enqueue_mode_command(data: Mapping[str, Any], queue_obj: queue.Queue[ModeEvent]) -> bool:
+    """Translate a JSON-compatible dict into one or more mode events."""
+    if len(data) == 1:
+        key, value = next(iter(data.items()))
+        handler = _HANDLERS.get(key)
+        return handler(value, queue_obj) if handler is not None else False
+    for key, handler in _HANDLERS.items():
+        if key in data:
+            return handler(data[key], queue_obj)
     return False
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-import json
 import os
 import queue
+import selectors
 import socket
 import threading
 from pathlib import Path
 
-from .commands import enqueue_mode_command
+from .commands import STOP, enqueue_mode_command, json_loads, run_dispatch_loop
 from .events import ModeEvent, ModeEventDispatcher, ModeEventListener
 
 
@@ -27,10 +27,13 @@ class SocketModeDispatcher(ModeEventDispatcher):
         self._stop_event = threading.Event()
         self._listener: ModeEventListener | None = None
         self._dispatcher_thread: threading.Thread | None = None
-        self._accept_thread: threading.Thread | None = None
+        self._serve_thread: threading.Thread | None = None
         self._server: socket.socket | None = None
-        self._connections: set[socket.socket] = set()
-        self._conn_lock = threading.Lock()
+        self._selector: selectors.BaseSelector | None = None
+        self._wakeup: tuple[socket.socket, socket.socket] | None = None
+        # Only touched from the serve thread once it is running.
+        self._buffers: dict[socket.socket, bytearray] = {}
+        self._pending: dict[socket.socket, bytearray] = {}
 
     def start(self, listener: ModeEventListener) -> None:  # type: ignore[override]
         self._stop_event.clear()
@@ -39,36 +42,27 @@ class SocketModeDispatcher(ModeEventDispatcher):
         self._prepare_socket()
         self._dispatcher_thread = threading.Thread(target=self._dispatch_loop, daemon=True)
         self._dispatcher_thread.start()
-        self._accept_thread = threading.Thread(target=self._accept_loop, daemon=True)
-        self._accept_thread.start()
+        self._serve_thread = threading.Thread(target=self._serve_loop, daemon=True)
+        self._serve_thread.start()
 
     def stop(self) -> None:  # type: ignore[override]
         self._stop_event.set()
-        if self._server is not None:
+        if self._queue is not None:
+            self._queue.put(STOP)  # type: ignore[arg-type]
+        if self._wakeup is not None:
             try:
-                self._server.close()
+                self._wakeup[1].send(b"\0")
             except OSError:
                 pass
-        with self._conn_lock:
-            for conn in list(self._connections):
-                try:
-                    conn.shutdown(socket.SHUT_RDWR)
-                except OSError:
-                    pass
-                try:
-                    conn.close()
-                except OSError:
-                    pass
-            self._connections.clear()
-        if self._accept_thread and self._accept_thread.is_alive():
-            self._accept_thread.join(timeout=0.5)
+        if self._serve_thread and self._serve_thread.is_alive():
+            self._serve_thread.join(timeout=0.5)
         if self._dispatcher_thread and self._dispatcher_thread.is_alive():
             self._dispatcher_thread.join(timeout=0.5)
+        self._close_sockets()
         self._queue = None
         self._listener = None
         self._dispatcher_thread = None
-        self._accept_thread = None
-        self._server = None
+        self._serve_thread = None
         if self._unlink_existing and self._path.exists():
             try:
                 self._path.unlink()
@@ -89,80 +83,145 @@ class SocketModeDispatcher(ModeEventDispatcher):
         server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         server.bind(str(self._path))
         server.listen(self._backlog)
-        server.settimeout(0.2)
+        server.setblocking(False)
+        wake_reader, wake_writer = socket.socketpair()
+        wake_reader.setblocking(False)
+        selector = selectors.DefaultSelector()
+        selector.register(server, selectors.EVENT_READ, self._accept_client)
+        selector.register(wake_reader, selectors.EVENT_READ, None)
         self._server = server
+        self._wakeup = (wake_reader, wake_writer)
+        self._selector = selector
 
-    def _accept_loop(self) -> None:
-        server = self._server
-        if server is None:
+    def _serve_loop(self) -> None:
+        selector = self._selector
+        if selector is None:
             return
-        while not self._stop_event.is_set():
-            try:
-                conn, _ = server.accept()
-            except TimeoutError:
-                continue
-            except OSError:
-                break
-            conn.setblocking(True)
-            with self._conn_lock:
-                self._connections.add(conn)
-            thread = threading.Thread(target=self._client_loop, args=(conn,), daemon=True)
-            thread.start()
-
-    def _client_loop(self, conn: socket.socket) -> None:
-        reader = None
         try:
-            reader = conn.makefile("r", encoding="utf-8", newline="\n")
             while not self._stop_event.is_set():
-                line = reader.readline()
-                if not line:
-                    break
-                payload = line.strip()
-                if not payload:
-                    continue
-                try:
-                    data = json.loads(payload)
-                except json.JSONDecodeError as exc:
-                    self._send_response(conn, f"ERROR: invalid JSON ({exc})\n")
-                    continue
-                if not isinstance(data, dict):
-                    self._send_response(conn, "ERROR: command must be a JSON object\n")
-                    continue
-                if self._handle_command(data):
-                    self._send_response(conn, "OK\n")
-                else:
-                    self._send_response(conn, "ERROR: unsupported command\n")
+                for key, mask in selector.select():
+                    callback = key.data
+                    if callback is None:
+                        # Wake-up from stop(); the loop condition handles the rest.
+                        continue
+                    callback(key.fileobj, mask)
+        except (OSError, ValueError):
+            # Selector or sockets closed underneath us during shutdown.
+            pass
+        finally:
+            self._close_sockets()
+
+    def _accept_client(self, server: socket.socket, mask: int) -> None:
+        try:
+            conn, _ = server.accept()
+        except BlockingIOError:
+            return
+        conn.setblocking(False)
+        self._buffers[conn] = bytearray()
+        self._selector.register(conn, selectors.EVENT_READ, self._service_client)
+
+    def _service_client(self, conn: socket.socket, mask: int) -> None:
+        if mask & selectors.EVENT_WRITE:
+            self._flush_pending(conn)
+        if not mask & selectors.EVENT_READ:
+            return
+        try:
+            data = conn.recv(65536)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        buffer = self._buffers.get(conn)
+        if buffer is None:
+            return
+        if not data:
+            # Peer closed; a final line without a trailing newline still counts.
+            if buffer:
+                self._process_line(conn, bytes(buffer))
+                buffer.clear()
+            self._close_connection(conn)
+            return
+        buffer += data
+        while conn in self._buffers:
+            index = buffer.find(b"\n")
+            if index < 0:
+                break
+            line = bytes(buffer[:index])
+            del buffer[: index + 1]
+            if not self._process_line(conn, line):
+                self._close_connection(conn)
+
+    def _process_line(self, conn: socket.socket, line: bytes) -> bool:
+        """Handle one command line; return False when the connection should close."""
+        payload = line.strip()
+        if not payload:
+            return True
+        try:
+            data = json_loads(payload)
+        except ValueError as exc:
+            self._send_response(conn, f"ERROR: invalid JSON ({exc})\n")
+            return True
+        if not isinstance(data, dict):
+            self._send_response(conn, "ERROR: command must be a JSON object\n")
+            return True
+        try:
+            handled = self._handle_command(data)
         except Exception as exc:
             self._send_response(conn, f"ERROR: {exc}\n")
-        finally:
-            if reader is not None:
-                try:
-                    reader.close()
-                except Exception:
-                    pass
+            return False
+        if handled:
+            self._send_response(conn, "OK\n")
+        else:
+            self._send_response(conn, "ERROR: unsupported command\n")
+        return True
+
+    def _close_connection(self, conn: socket.socket) -> None:
+        pending = self._pending.pop(conn, None)
+        if pending:
             try:
-                conn.shutdown(socket.SHUT_RDWR)
+                conn.send(pending)
             except OSError:
                 pass
+        self._buffers.pop(conn, None)
+        if self._selector is not None:
             try:
-                conn.close()
-            except OSError:
+                self._selector.unregister(conn)
+            except (KeyError, ValueError):
                 pass
-            with self._conn_lock:
-                self._connections.discard(conn)
+        try:
+            conn.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        try:
+            conn.close()
+        except OSError:
+            pass
 
+    def _close_sockets(self) -> None:
+        for conn in list(self._buffers):
+            self._close_connection(conn)
+        selector, self._selector = self._selector, None
+        if selector is not None:
+            try:
+                selector.close()
+            except (OSError, ValueError):
+                pass
+        server, self._server = self._server, None
+        wakeup, self._wakeup = self._wakeup, None
+        for sock in (server, *(wakeup or ())):
+            if sock is None:
+                continue
+            try:
+                sock.close()
+            except OSError:
+                pass
 
     def _dispatch_loop(self) -> None:
         queue_obj = self._queue
         listener = self._listener
         if queue_obj is None or listener is None:
             return
-        while not self._stop_event.is_set():
-            try:
-                event = queue_obj.get(timeout=0.1)
-            except queue.Empty:
-                continue
-            listener(event)
+        run_dispatch_loop(queue_obj, listener)
 
     def _handle_command(self, data: dict) -> bool:
         queue_obj = self._queue
@@ -171,8 +230,35 @@ class SocketModeDispatcher(ModeEventDispatcher):
         return enqueue_mode_command(data, queue_obj)
 
     def _send_response(self, conn: socket.socket, message: str) -> None:
+        data = message.encode("utf-8")
+        pending = self._pending.get(conn)
+        if pending is not None:
+            pending += data
+            return
         try:
-            conn.sendall(message.encode("utf-8"))
+            sent = conn.send(data)
+        except BlockingIOError:
+            sent = 0
         except OSError:
-            pass
+            return
+        if sent < len(data):
+            self._pending[conn] = bytearray(data[sent:])
+            self._selector.modify(
+                conn, selectors.EVENT_READ | selectors.EVENT_WRITE, self._service_client
+            )
 
+    def _flush_pending(self, conn: socket.socket) -> None:
+        pending = self._pending.get(conn)
+        if pending is None:
+            return
+        try:
+            sent = conn.send(pending)
+        except BlockingIOError:
+            return
+        except OSError:
+            self._close_connection(conn)
+            return
+        del pending[:sent]
+        if not pending:
+            del self._pending[conn]
+            self._selector.modify(conn, selectors.EVENT_READ, self._service_client)
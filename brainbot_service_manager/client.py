@@ -42,11 +42,14 @@ class ServiceManagerClient(BaseZMQClient):
         status = response.get("service")
         if isinstance(status, dict) and status.get("state") == "running":
             return
-        # If the manager reports pending readiness, poll until deadline.
+        # If the manager reports pending readiness, poll until deadline, starting
+        # fast and backing off so slow services are not hammered with RPCs.
+        delay = 0.005
         while time.time() < deadline:
             info = self.list_services()
             service_state = info.get("services", {}).get(service)
             if isinstance(service_state, dict) and service_state.get("state") == "running":
                 return
-            time.sleep(0.1)
+            time.sleep(max(0.0, min(delay, deadline - time.time())))
+            delay = min(delay * 1.5, 0.1)
         raise TimeoutError(f"Timed out waiting for service '{service}' to become ready")
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import errno
 import os
+import select
+import selectors
 import shlex
 import signal
 import socket
@@ -14,6 +17,67 @@ from typing import Any, Sequence
 from brainbot_core.transport import BaseZMQServer
 
 
+def _open_pidfd(process: subprocess.Popen[Any] | None) -> int | None:
+    """Return a pidfd for ``process`` (Linux 5.3+), or None where unsupported."""
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if process is None or pidfd_open is None:
+        return None
+    try:
+        return pidfd_open(process.pid)
+    except OSError:
+        return None
+
+
+def _wait_process(process: subprocess.Popen[Any], timeout: float) -> bool:
+    """Wait up to ``timeout`` seconds for ``process`` to exit; True once it is reaped."""
+    timeout = max(timeout, 0.0)
+    pidfd = _open_pidfd(process)
+    if pidfd is None:
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            return False
+        return True
+    try:
+        poller = select.poll()
+        poller.register(pidfd, select.POLLIN)
+        poller.poll(timeout * 1000.0)
+    finally:
+        os.close(pidfd)
+    return process.poll() is not None
+
+
+def _connect_once(
+    selector: selectors.BaseSelector,
+    family: int,
+    socktype: int,
+    proto: int,
+    address: Any,
+    timeout: float,
+) -> int | None:
+    """Try one non-blocking connect; return 0 or an errno, or None if interrupted.
+
+    ``selector`` may also carry a pidfd registered with data ``"exit"``, in which
+    case a child exit cuts the wait short.
+    """
+    sock = socket.socket(family, socktype, proto)
+    try:
+        sock.setblocking(False)
+        err = sock.connect_ex(address)
+        if err in (errno.EINPROGRESS, errno.EAGAIN, errno.EWOULDBLOCK):
+            selector.register(sock, selectors.EVENT_WRITE, "connect")
+            try:
+                ready = {key.data for key, _ in selector.select(timeout)}
+            finally:
+                selector.unregister(sock)
+            if "exit" in ready or "connect" not in ready:
+                return None
+            err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        return err
+    finally:
+        sock.close()
+
+
 @dataclass(slots=True)
 class ServiceSpec:
     """Specification for a managed subprocess."""
@@ -134,50 +198,129 @@ class ServiceManager(BaseZMQServer):
         if spec.env:
             env.update({key: str(value) for key, value in spec.env.items()})
         print(f"[service-manager] starting service '{spec.name}': {' '.join(command)} (cwd={cwd or os.getcwd()})")
-        process = subprocess.Popen(command, cwd=cwd, env=env, stdout=None, stderr=None)
+        # Own session: a terminal Ctrl-C reaches only the manager, which then stops
+        # each service once through _stop_service instead of racing a second SIGINT.
+        process = subprocess.Popen(
+            command,
+            cwd=cwd,
+            env=env,
+            stdout=None,
+            stderr=None,
+            close_fds=True,
+            start_new_session=True,
+        )
         runner = RunningService(spec=spec, process=process, started_at=time.time())
         timeout = timeout_override if timeout_override is not None else spec.start_timeout_s
         if spec.ready_port is not None:
-            self._wait_for_port(spec.ready_host, spec.ready_port, timeout)
+            try:
+                self._wait_for_port(spec.ready_host, spec.ready_port, timeout, process)
+            except BaseException:
+                # The child is in its own session and not yet in _running, so
+                # neither the terminal nor close() would ever stop it.
+                self._stop_service(runner)
+                raise
         return runner
 
     def _stop_service(self, runner: RunningService, timeout_override: float | None = None) -> None:
-        proc = runner.process
-        if proc is None:
-            return
-        if proc.poll() is not None:
+        if not self._signal_service(runner):
             return
         timeout = timeout_override if timeout_override is not None else runner.spec.stop_grace_s
+        self._finish_stop(runner, time.monotonic() + timeout, timeout)
+
+    @staticmethod
+    def _signal_service(runner: RunningService) -> bool:
+        """Send SIGINT to a live service; return False when there is nothing to stop."""
+        proc = runner.process
+        if proc is None or proc.poll() is not None:
+            return False
         print(f"[service-manager] stopping service '{runner.spec.name}' (pid={proc.pid})")
         proc.send_signal(signal.SIGINT)
-        try:
-            proc.wait(timeout=timeout)
-        except subprocess.TimeoutExpired:
-            print(f"[service-manager] service '{runner.spec.name}' did not exit in {timeout:.1f}s; killing")
-            proc.kill()
-            try:
-                proc.wait(timeout=5.0)
-            except subprocess.TimeoutExpired:
-                print(f"[service-manager] service '{runner.spec.name}' did not respond to SIGKILL")
+        return True
+
+    @staticmethod
+    def _finish_stop(runner: RunningService, deadline: float, timeout: float) -> None:
+        proc = runner.process
+        if proc is None:
+            return
+        if _wait_process(proc, deadline - time.monotonic()):
+            return
+        print(f"[service-manager] service '{runner.spec.name}' did not exit in {timeout:.1f}s; killing")
+        proc.kill()
+        if not _wait_process(proc, 5.0):
+            print(f"[service-manager] service '{runner.spec.name}' did not respond to SIGKILL")
 
     @staticmethod
-    def _wait_for_port(host: str, port: int, timeout: float) -> None:
-        deadline = time.time() + timeout
+    def _wait_for_port(
+        host: str,
+        port: int,
+        timeout: float,
+        process: subprocess.Popen[Any] | None = None,
+    ) -> None:
+        """Block until ``host:port`` accepts a connection or ``process`` exits."""
+        deadline = time.monotonic() + timeout
+        selector = selectors.DefaultSelector()
+        pidfd = _open_pidfd(process)
+        if pidfd is not None:
+            selector.register(pidfd, selectors.EVENT_READ, "exit")
         last_error: Exception | None = None
-        while time.time() < deadline:
-            try:
-                with socket.create_connection((host, port), timeout=0.5):
-                    return
-            except OSError as exc:  # pragma: no cover - network dependent
-                last_error = exc
-                time.sleep(0.2)
+
+        def check_exit() -> None:
+            if process is not None and process.poll() is not None:
+                raise RuntimeError(
+                    f"Service exited with code {process.returncode} before {host}:{port} was ready"
+                )
+
+        try:
+            while True:
+                check_exit()
+                if deadline - time.monotonic() <= 0:
+                    break
+                # Resolve on every attempt and try each address, like
+                # socket.create_connection: "localhost" may list ::1 first while
+                # the service only binds IPv4, and DNS may not be up yet.
+                try:
+                    addresses = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+                except OSError as exc:
+                    addresses = []
+                    last_error = exc
+                for family, socktype, proto, _, address in addresses:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    err = _connect_once(selector, family, socktype, proto, address, remaining)
+                    if err == 0:
+                        return
+                    if err is None:
+                        break
+                    last_error = OSError(err, os.strerror(err))
+                # Nothing listening yet: back off briefly, still waking on child exit.
+                backoff = min(0.05, max(0.0, deadline - time.monotonic()))
+                if pidfd is not None:
+                    selector.select(backoff)
+                else:
+                    time.sleep(backoff)
+        finally:
+            selector.close()
+            if pidfd is not None:
+                os.close(pidfd)
         raise TimeoutError(f"Timed out waiting for service on {host}:{port}") from last_error
 
     def close(self) -> None:
         with self._lock:
+            # Signal every service first so their shutdowns overlap, then collect
+            # them; the total wait is the slowest grace period rather than the sum.
+            stopping: list[tuple[RunningService, float]] = []
             for runner in list(self._running.values()):
                 try:
-                    self._stop_service(runner)
+                    if self._signal_service(runner):
+                        stopping.append((runner, time.monotonic() + runner.spec.stop_grace_s))
+                    else:
+                        print(f"[service-manager] service '{runner.spec.name}' stopped")
+                except Exception as exc:  # pragma: no cover - defensive
+                    print(f"[service-manager] failed to stop service '{runner.spec.name}': {exc}")
+            for runner, deadline in stopping:
+                try:
+                    self._finish_stop(runner, deadline, runner.spec.stop_grace_s)
                     print(f"[service-manager] service '{runner.spec.name}' stopped")
                 except Exception as exc:  # pragma: no cover - defensive
                     print(f"[service-manager] failed to stop service '{runner.spec.name}': {exc}")
@@ -71,7 +71,9 @@ class TeleopActionServer(BaseZMQServer):
             if self.robot_action_processor
             else teleop_action
         )
-        message = MessageSerializer.to_dict(ActionMessage(actions=dict(robot_action)))
+        # Fresh per call and packed straight away, so no defensive copy is needed.
+        actions = robot_action if isinstance(robot_action, dict) else dict(robot_action)
+        message = MessageSerializer.to_dict(ActionMessage(actions=actions))
         return {"action": message}
 
     def _handle_sync_config(self, config: dict[str, Any]) -> dict[str, Any]:
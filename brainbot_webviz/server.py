@@ -1,10 +1,16 @@
 from __future__ import annotations
 
-import base64
+import binascii
+import collections
+import gzip
+import hashlib
 import json
+import os
+import socket
 import threading
 import time
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any, Callable
@@ -18,6 +24,27 @@ try:
 except ImportError:  # pragma: no cover - optional dependency
     cv2 = None  # type: ignore[assignment]
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import pybase64
+except ImportError:  # pragma: no cover - optional dependency
+    pybase64 = None  # type: ignore[assignment]
+
+try:
+    import simplejpeg
+except ImportError:  # pragma: no cover - optional dependency
+    simplejpeg = None  # type: ignore[assignment]
+
+
+def _dumps_json(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data).encode("utf-8")
+
 
 class VisualizationServer:
     def __init__(
@@ -29,7 +56,8 @@ class VisualizationServer:
     ):
         self.host = host
         self.port = port
-        self._lock = threading.Lock()
+        # Snapshots are replaced wholesale, never mutated, so readers can take the
+        # current reference without a lock.
         self._data: dict[str, Any] = {
             "observation": {},
             "action": {},
@@ -38,10 +66,25 @@ class VisualizationServer:
             "history": [],
             "previews": {},
         }
-        self._history: list[dict[str, Any]] = []
-        self._camera_lock = threading.Lock()
+        self._data_json: tuple[dict[str, Any] | None, bytes] = (None, b"")
+        self._data_gzip: tuple[bytes | None, bytes] = (None, b"")
+        # The snapshot minus its history, serialized once for all /events streams.
+        self._frame_json: tuple[dict[str, Any] | None, bytes] = (None, b"")
+        # Notified whenever _data is replaced; /events streams wait on it.
+        self._updated = threading.Condition()
+        self._closing = False
+        self._history: collections.deque[dict[str, Any]] = collections.deque(maxlen=200)
+        # Stamped on each history entry; /events diffs on it, not on wall-clock time.
+        self._history_seq = 0
+        # Replaced, never mutated, by the camera subscriber thread (the only writer).
         self._camera_frames: dict[str, dict[str, Any]] = {}
+        self._camera_raw: dict[str, tuple[bytes, str]] = {}
+        # One BGR scratch image per inline preview label for the cv2 encoder.
+        self._bgr_buffers: dict[str, np.ndarray] = {}
         self._camera_subscriber: CameraSubscriber | None = None
+        self._encode_pool = ThreadPoolExecutor(
+            max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="webviz-jpeg"
+        )
         self._server = ThreadingHTTPServer((self.host, self.port), self._handler_factory())
         self._thread: threading.Thread | None = None
 
@@ -56,20 +99,68 @@ class VisualizationServer:
         outer = self
 
         class Handler(BaseHTTPRequestHandler):
+            # Keep the dashboard's 100 ms polls on one connection; every response
+            # sets Content-Length so HTTP/1.1 framing works.
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                try:
+                    self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                except OSError:
+                    pass
+
             def do_GET(self):  # noqa: N802
-                if self.path == "/data":
-                    with outer._lock:
-                        payload = json.dumps(outer._data).encode("utf-8")
-                    self.send_response(HTTPStatus.OK)
-                    self.send_header("Content-Type", "application/json")
-                    self.send_header("Cache-Control", "no-store")
-                    self.end_headers()
-                    self.wfile.write(payload)
+                if self.path == "/events":
+                    outer._stream_events(self)
+                elif self.path == "/data":
+                    if _accepts_gzip(self.headers.get("Accept-Encoding", "")):
+                        self._send_body(
+                            "application/json",
+                            outer._snapshot_gzip(),
+                            ("Cache-Control", "no-store"),
+                            ("Content-Encoding", "gzip"),
+                            ("Vary", "Accept-Encoding"),
+                        )
+                    else:
+                        self._send_body(
+                            "application/json",
+                            outer._snapshot_json(),
+                            ("Cache-Control", "no-store"),
+                            ("Vary", "Accept-Encoding"),
+                        )
                 else:
-                    self.send_response(HTTPStatus.OK)
-                    self.send_header("Content-Type", "text/html; charset=utf-8")
+                    self._send_dashboard()
+
+            def _send_dashboard(self) -> None:
+                # Pick the representation first so a 304 only matches its own ETag
+                # and repeats the headers its 200 would carry.
+                if _accepts_gzip(self.headers.get("Accept-Encoding", "")):
+                    body, etag = _DASHBOARD_HTML_GZIP, _DASHBOARD_GZIP_ETAG
+                    encoding: tuple[tuple[str, str], ...] = (("Content-Encoding", "gzip"),)
+                else:
+                    body, etag, encoding = _DASHBOARD_HTML_BYTES, _DASHBOARD_ETAG, ()
+                cache_headers = (("Vary", "Accept-Encoding"), ("ETag", etag), ("Cache-Control", "no-cache"))
+                if _etag_matches(self.headers.get("If-None-Match"), etag):
+                    self.send_response(HTTPStatus.NOT_MODIFIED)
+                    for name, value in cache_headers:
+                        self.send_header(name, value)
                     self.end_headers()
-                    self.wfile.write(_DASHBOARD_HTML.encode("utf-8"))
+                else:
+                    self._send_body("text/html; charset=utf-8", body, *encoding, *cache_headers)
+
+            def _send_body(self, content_type: str, body: bytes, *headers: tuple[str, str]) -> None:
+                self.send_response(HTTPStatus.OK)
+                self.send_header("Content-Type", content_type)
+                for name, value in headers:
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                # end_headers() would flush the header block by itself; send it with
+                # the body in one gather write so NODELAY doesn't split the reply.
+                self._headers_buffer.append(b"\r\n")
+                head = b"".join(self._headers_buffer)
+                self._headers_buffer = []
+                _send_gather(self.connection, head, body)
 
             def log_message(self, format, *args):  # noqa: A003
                 return
@@ -82,60 +173,158 @@ class VisualizationServer:
             self._thread.start()
 
     def stop(self) -> None:
+        with self._updated:
+            self._closing = True
+            self._updated.notify_all()
         self._server.shutdown()
         if self._thread:
             self._thread.join(timeout=1.0)
         if self._camera_subscriber:
             self._camera_subscriber.stop()
+        self._encode_pool.shutdown(wait=False)
 
     def update(self, observation: dict[str, Any], action: dict[str, Any], mode: str) -> None:
         observation_snapshot = _summarize_payload(observation)
-        clean_action = _sanitize_payload(action)
-
-        numeric_values = _extract_numeric(action)
+        clean_action, numeric_values = _sanitize_and_extract(action)
         entry = {"timestamp": time.time(), "values": numeric_values}
         if numeric_values:
+            self._history_seq += 1
+            entry["seq"] = self._history_seq
             self._history.append(entry)
-            if len(self._history) > 200:
-                self._history = self._history[-200:]
 
-        history_snapshot = [
-            {"timestamp": item["timestamp"], "values": dict(item["values"])}
-            for item in self._history
-        ]
+        # Entries are never modified after they are appended, so snapshots can share them.
+        history_snapshot = list(self._history)
 
         previews = self._snapshot_camera_frames()
         if not previews:
-            previews = _extract_inline_previews(observation)
-
-        with self._lock:
-            self._data = {
-                "observation": observation_snapshot,
-                "action": clean_action,
-                "timestamp": entry["timestamp"],
-                "mode": mode,
-                "history": history_snapshot,
-                "previews": previews,
-            }
+            previews = _extract_inline_previews(observation, self._encode_pool, self._bgr_buffers)
+
+        self._data = {
+            "observation": observation_snapshot,
+            "action": clean_action,
+            "timestamp": entry["timestamp"],
+            "mode": mode,
+            "history": history_snapshot,
+            "previews": previews,
+        }
+        with self._updated:
+            self._updated.notify_all()
+
+    def _snapshot_json(self, data: dict[str, Any] | None = None) -> bytes:
+        """Serialize the current snapshot once, however many dashboards poll it."""
+        if data is None:
+            data = self._data
+        cached_for, payload = self._data_json
+        if cached_for is not data:
+            payload = _dumps_json(data)
+            self._data_json = (data, payload)
+        return payload
+
+    def _frame_json_for(self, data: dict[str, Any]) -> bytes:
+        cached_for, payload = self._frame_json
+        if cached_for is not data:
+            payload = _dumps_json({key: value for key, value in data.items() if key != "history"})
+            self._frame_json = (data, payload)
+        return payload
+
+    def _stream_events(self, handler: BaseHTTPRequestHandler) -> None:
+        """Push each new snapshot as a server-sent event until the client leaves.
+
+        The first event carries the full snapshot with ``reset`` set; later ones
+        carry the snapshot without its history plus the entries the client has
+        not seen yet. Both snapshot forms are serialized once per update and
+        shared by every stream; only the small history delta is per client.
+        """
+        handler.send_response(HTTPStatus.OK)
+        handler.send_header("Content-Type", "text/event-stream")
+        handler.send_header("Cache-Control", "no-store")
+        handler.send_header("Connection", "close")
+        handler.end_headers()
+        handler.close_connection = True
+        sent: dict[str, Any] | None = None
+        last_seq: int | None = None
+        try:
+            while True:
+                with self._updated:
+                    changed = self._updated.wait_for(
+                        lambda: self._data is not sent or self._closing,
+                        timeout=_EVENTS_KEEPALIVE_S,
+                    )
+                if self._closing:
+                    return
+                if not changed:
+                    handler.wfile.write(b": keepalive\n\n")
+                    continue
+                sent = self._data
+                history = sent["history"]
+                if last_seq is None:
+                    event = b'data: {"reset":true,"snapshot":' + self._snapshot_json(sent) + b"}\n\n"
+                else:
+                    event = b"".join((
+                        b'data: {"reset":false,"snapshot":',
+                        self._frame_json_for(sent),
+                        b',"history":',
+                        _dumps_json(_history_since(history, last_seq)),
+                        b"}\n\n",
+                    ))
+                last_seq = history[-1]["seq"] if history else (last_seq or 0)
+                handler.wfile.write(event)
+                # update() can run far faster than anyone can watch.
+                time.sleep(_EVENTS_MIN_INTERVAL_S)
+        except (BrokenPipeError, ConnectionResetError):
+            return
+
+    def _snapshot_gzip(self) -> bytes:
+        """Gzip the serialized snapshot once; history key names compress well."""
+        raw = self._snapshot_json()
+        cached_for, payload = self._data_gzip
+        if cached_for is not raw:
+            payload = gzip.compress(raw, compresslevel=1, mtime=0)
+            self._data_gzip = (raw, payload)
+        return payload
 
     def _snapshot_camera_frames(self) -> dict[str, Any]:
-        with self._camera_lock:
-            return {name: dict(frame) for name, frame in self._camera_frames.items()}
+        return self._camera_frames
 
     def _on_camera_frame(self, name: str, payload: dict[str, Any]) -> None:
         data = payload.get("data")
         if not isinstance(data, (bytes, bytearray)):
             return
-        encoded = base64.b64encode(data).decode("ascii")
+        # A static scene or a stalled camera republishes identical JPEGs; reuse the
+        # previous data URL instead of base64-encoding the same bytes again.
+        previous = self._camera_raw.get(name)
+        if previous is not None and previous[0] == data:
+            src = previous[1]
+        else:
+            src = _jpeg_data_url(data)
+            self._camera_raw[name] = (bytes(data), src)
         frame_info = {
             "camera": name,
             "timestamp": float(payload.get("timestamp", time.time())),
             "width": int(payload.get("width", 0)),
             "height": int(payload.get("height", 0)),
-            "src": f"data:image/jpeg;base64,{encoded}",
+            "src": src,
         }
-        with self._camera_lock:
-            self._camera_frames[name] = frame_info
+        self._camera_frames = {**self._camera_frames, name: frame_info}
+
+
+_EVENTS_MIN_INTERVAL_S = 0.1
+_EVENTS_KEEPALIVE_S = 15.0
+
+
+def _history_since(history: list[dict[str, Any]], seq: int) -> list[dict[str, Any]]:
+    start = len(history)
+    while start > 0 and history[start - 1]["seq"] > seq:
+        start -= 1
+    return history[start:]
+
+
+_SANITIZE_SKIP_KEYS = frozenset({"message_type", "timestamp_ns", "version"})
+# Values that can never coerce to float; checked up front so they do not pay
+# for a raised TypeError on every update.
+_NON_NUMERIC_TYPES = (Mapping, list, tuple, set, type(None))
+# The chart never resolves past this; shorter numbers keep /data small.
+_HISTORY_DECIMALS = 4
 
 
 def _sanitize_payload(obj: Any, prefix: str | None = None) -> Any:
@@ -143,7 +332,7 @@ def _sanitize_payload(obj: Any, prefix: str | None = None) -> Any:
     if isinstance(obj, dict):
         result: dict[str, Any] = {}
         for key, value in obj.items():
-            if key in {"message_type", "timestamp_ns", "version"}:
+            if key in _SANITIZE_SKIP_KEYS:
                 continue
             child_prefix = f"{name_prefix}.{key}" if name_prefix else key
             result[key] = _sanitize_payload(value, child_prefix)
@@ -155,85 +344,250 @@ def _sanitize_payload(obj: Any, prefix: str | None = None) -> Any:
     return obj
 
 
-def _extract_numeric(action: dict[str, Any]) -> dict[str, float]:
+def _sanitize_and_extract(action: dict[str, Any]) -> tuple[dict[str, Any], dict[str, float]]:
+    """Sanitize ``action`` and collect its plottable values in the same walk.
+
+    Numeric values come from the ``actions`` sub-dict when present, otherwise
+    from the top level of ``action``.
+    """
     numeric: dict[str, float] = {}
     values = action.get("actions", action)
-    if isinstance(values, dict):
-        iterator = values.items()
-    else:
-        iterator = action.items()
-    for key, value in iterator:
-        try:
-            numeric[key] = float(value)
-        except (TypeError, ValueError):
+    if values is action or not isinstance(values, dict):
+        return _sanitize_level(action, numeric), numeric
+    clean: dict[str, Any] = {}
+    for key, value in action.items():
+        if key in _SANITIZE_SKIP_KEYS:
+            continue
+        if key == "actions":
+            clean[key] = _sanitize_level(value, numeric)
+        else:
+            clean[key] = _sanitize_payload(value, key)
+    return clean, numeric
+
+
+def _sanitize_level(obj: dict[str, Any], numeric: dict[str, float]) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    for key, value in obj.items():
+        if type(value) is float:
+            numeric[key] = round(value, _HISTORY_DECIMALS)
+        elif isinstance(value, (int, np.integer, np.floating)):
+            numeric[key] = round(float(value), _HISTORY_DECIMALS)
+        elif not isinstance(value, _NON_NUMERIC_TYPES):
+            try:
+                numeric[key] = round(float(value), _HISTORY_DECIMALS)
+            except (TypeError, ValueError):
+                pass
+        if key in _SANITIZE_SKIP_KEYS:
             continue
-    return numeric
+        result[key] = _sanitize_payload(value, key)
+    return result
 
 
-def _extract_inline_previews(observation: Any) -> dict[str, Any]:
-    frames: dict[str, Any] = {}
-    if not isinstance(observation, Mapping):
-        return frames
+_PREVIEW_WALK_TYPES = (Mapping, list, tuple, np.ndarray)
 
-    def _walk(node: Any, prefix: str) -> None:
-        if isinstance(node, Mapping):
-            for key, value in node.items():
-                name = f"{prefix}.{key}" if prefix else str(key)
-                _walk(value, name)
-            return
-        if isinstance(node, (list, tuple)):
-            for idx, value in enumerate(node):
-                name = f"{prefix}[{idx}]"
-                _walk(value, name)
-            return
-        if isinstance(node, np.ndarray):
-            label = prefix or "observation"
-            frame_info = _encode_inline_frame(label, node)
-            if frame_info:
-                frames[label] = frame_info
 
-    _walk(observation, "")
+def _find_image_arrays(observation: Mapping[str, Any]) -> list[tuple[str, np.ndarray]]:
+    """Return ``(label, array)`` for every 2-D/3-D array, in depth-first order.
+
+    Iterative, and labels are only built for containers and arrays, so long
+    lists of joint values are skipped without formatting a name per element.
+    """
+    found: list[tuple[str, np.ndarray]] = []
+    stack: list[tuple[str, Any]] = [("", observation)]
+    while stack:
+        prefix, node = stack.pop()
+        if isinstance(node, np.ndarray):
+            if node.ndim in (2, 3):
+                found.append((prefix or "observation", node))
+            continue
+        if isinstance(node, Mapping):
+            children = [
+                (f"{prefix}.{key}" if prefix else str(key), value)
+                for key, value in node.items()
+                if isinstance(value, _PREVIEW_WALK_TYPES)
+            ]
+        else:
+            children = [
+                (f"{prefix}[{idx}]", value)
+                for idx, value in enumerate(node)
+                if isinstance(value, _PREVIEW_WALK_TYPES)
+            ]
+        stack.extend(reversed(children))
+    return found
+
+
+def _extract_inline_previews(
+    observation: Any,
+    executor: ThreadPoolExecutor | None = None,
+    bgr_buffers: dict[str, np.ndarray] | None = None,
+) -> dict[str, Any]:
+    frames: dict[str, Any] = {}
+    # Without an encoder every frame would be dropped anyway; don't walk.
+    if not isinstance(observation, Mapping) or (cv2 is None and simplejpeg is None):
+        return frames
+    pending = _find_image_arrays(observation)
+    if not pending:
+        return frames
+    # cv2.imencode releases the GIL, so cameras encode in parallel on the pool.
+    if executor is not None and len(pending) > 1:
+        encoded = list(executor.map(lambda item: _encode_inline_frame(*item, bgr_buffers), pending))
+    else:
+        encoded = [_encode_inline_frame(label, node, bgr_buffers) for label, node in pending]
+    for (label, _), frame_info in zip(pending, encoded):
+        if frame_info:
+            frames[label] = frame_info
     return frames
 
 
-def _encode_inline_frame(name: str, frame: np.ndarray) -> dict[str, Any] | None:
-    if cv2 is None:
+def _etag_matches(header: str | None, etag: str) -> bool:
+    """Whether an If-None-Match value names ``etag`` (weak comparison) or is ``*``."""
+    if not header:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def _accepts_gzip(header: str) -> bool:
+    """Whether an Accept-Encoding value allows gzip (RFC 9110 section 12.5.3)."""
+    wildcard = False
+    for item in header.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding in ("gzip", "x-gzip"):
+            # An explicit entry wins over any "*".
+            return quality > 0
+        if coding == "*":
+            wildcard = quality > 0
+    return wildcard
+
+
+def _send_gather(conn: socket.socket, *chunks: bytes) -> None:
+    """Write ``chunks`` back to back without concatenating them first."""
+    if not hasattr(conn, "sendmsg"):  # pragma: no cover - Windows
+        conn.sendall(b"".join(chunks))
+        return
+    views = [memoryview(chunk) for chunk in chunks]
+    while views:
+        sent = conn.sendmsg(views)
+        while views and sent >= len(views[0]):
+            sent -= len(views.pop(0))
+        if sent:
+            views[0] = views[0][sent:]
+
+
+_JPEG_DATA_URL_PREFIX = b"data:image/jpeg;base64,"
+
+
+def _jpeg_data_url(data: Any) -> str:
+    if pybase64 is not None:
+        # Encodes straight into a str, skipping the bytes -> str decode copy.
+        return "data:image/jpeg;base64," + pybase64.b64encode_as_string(data)
+    encoded = binascii.b2a_base64(data, newline=False)
+    return (_JPEG_DATA_URL_PREFIX + encoded).decode("ascii")
+
+
+def _bgr_buffer(buffers: dict[str, np.ndarray] | None, name: str, size: tuple[int, int]) -> np.ndarray:
+    """Return ``name``'s scratch image, replacing it when the frame size changes.
+
+    imencode consumes the buffer before the next update, and labels are unique
+    within one update, so pool threads never share a buffer.
+    """
+    shape = (int(size[0]), int(size[1]), 3)
+    buffer = buffers.get(name) if buffers is not None else None
+    if buffer is None or buffer.shape != shape:
+        buffer = np.empty(shape, dtype=np.uint8)
+        if buffers is not None:
+            buffers[name] = buffer
+    return buffer
+
+
+# The dashboard shows previews at most 320 px wide; encoding more is wasted work.
+_PREVIEW_MAX_EDGE = 480
+_CV2_RESIZE_DTYPES = frozenset(np.dtype(t) for t in (np.uint8, np.uint16, np.float32, np.float64))
+
+
+def _shrink_for_preview(image: np.ndarray) -> np.ndarray:
+    height, width = image.shape[:2]
+    long_edge = max(height, width)
+    if long_edge <= _PREVIEW_MAX_EDGE:
+        return image
+    if cv2 is not None and image.dtype in _CV2_RESIZE_DTYPES:
+        scale = _PREVIEW_MAX_EDGE / long_edge
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+    step = -(-long_edge // _PREVIEW_MAX_EDGE)
+    return image[::step, ::step]
+
+
+def _encode_inline_frame(
+    name: str, frame: np.ndarray, bgr_buffers: dict[str, np.ndarray] | None = None
+) -> dict[str, Any] | None:
+    if cv2 is None and simplejpeg is None:
         return None
-    image = np.asarray(frame)
+    image = frame
     if image.ndim not in (2, 3):
         return None
     if image.ndim == 3 and image.shape[2] not in (1, 3, 4):
         return None
-    height, width = (image.shape[:2] if image.ndim >= 2 else (0, 0))
+    height, width = image.shape[:2]
     if height < 32 or width < 32:
         return None
+    # Decide the float scaling on the full frame, but convert only after
+    # shrinking so the copies below are preview-sized.
+    unit_range = image.dtype != np.uint8 and np.issubdtype(image.dtype, np.floating) and image.max() <= 1.0
+    if image.ndim == 3 and image.shape[2] == 1:
+        image = np.squeeze(image, axis=2)
+    image = _shrink_for_preview(image)
+    # Three-channel frames are RGB; four-channel frames keep their first three
+    # channels as-is (BGR order), as they always have.
+    colorspace = "RGB"
+    if image.ndim == 3 and image.shape[2] == 4:
+        image = image[..., :3]
+        colorspace = "BGR"
     if image.dtype != np.uint8:
-        if np.issubdtype(image.dtype, np.floating):
-            scaled = image
-            if scaled.max() <= 1.0:
-                scaled = scaled * 255.0
-            image = np.clip(scaled, 0, 255).astype(np.uint8)
+        if unit_range:
+            scaled = np.multiply(image, 255.0)
+            np.clip(scaled, 0, 255, out=scaled)
+            image = scaled.astype(np.uint8)
         else:
             image = np.clip(image, 0, 255).astype(np.uint8)
-    if image.ndim == 3:
-        if image.shape[2] == 1:
-            image = np.squeeze(image, axis=2)
-        elif image.shape[2] == 4:
-            image = image[..., :3]
+    if simplejpeg is not None:
+        # libjpeg-turbo takes RGB/gray directly, so no colour conversion pass.
+        if image.ndim == 2:
+            buffer = simplejpeg.encode_jpeg(
+                np.ascontiguousarray(image)[..., np.newaxis], quality=75, colorspace="GRAY"
+            )
         else:
-            image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
-    if image.ndim == 2:
-        image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
-    success, buffer = cv2.imencode(".jpg", image, [int(cv2.IMWRITE_JPEG_QUALITY), 75])
-    if not success:
-        return None
-    encoded = base64.b64encode(buffer).decode("ascii")
+            buffer = simplejpeg.encode_jpeg(
+                np.ascontiguousarray(image), quality=75, colorspace=colorspace, fastdct=True
+            )
+    else:
+        if image.ndim == 2:
+            dst = _bgr_buffer(bgr_buffers, name, image.shape[:2])
+            image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR, dst=dst)
+        elif colorspace == "RGB":
+            dst = _bgr_buffer(bgr_buffers, name, image.shape[:2])
+            image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR, dst=dst)
+        success, buffer = cv2.imencode(".jpg", image, [int(cv2.IMWRITE_JPEG_QUALITY), 75])
+        if not success:
+            return None
     return {
         "camera": name or "observation",
         "timestamp": time.time(),
-        "width": int(image.shape[1]),
-        "height": int(image.shape[0]),
-        "src": f"data:image/jpeg;base64,{encoded}",
+        "width": int(width),
+        "height": int(height),
+        "src": _jpeg_data_url(buffer),
     }
 
 
@@ -312,22 +666,37 @@ _DASHBOARD_HTML = """
       return null;
     }
 
+    function render(data) {
+      document.getElementById('mode').textContent = data.mode || 'unknown';
+      document.getElementById('ts').textContent = new Date(data.timestamp * 1000).toLocaleString();
+      document.getElementById('obs').textContent = JSON.stringify(data.observation, null, 2);
+      document.getElementById('act').textContent = JSON.stringify(data.action, null, 2);
+      updateChart(data.history || []);
+      updateImages(data.previews || {});
+    }
+
     async function refresh() {
       try {
         const res = await fetch('/data', { cache: 'no-store' });
         if (!res.ok) return;
-        const data = await res.json();
-        document.getElementById('mode').textContent = data.mode || 'unknown';
-        document.getElementById('ts').textContent = new Date(data.timestamp * 1000).toLocaleString();
-        document.getElementById('obs').textContent = JSON.stringify(data.observation, null, 2);
-        document.getElementById('act').textContent = JSON.stringify(data.action, null, 2);
-        updateChart(data.history || []);
-        updateImages(data.previews || {});
+        render(await res.json());
       } catch (err) {
         console.error('Refresh error', err);
       }
     }
 
+    function onEvent(evt) {
+      try {
+        const message = JSON.parse(evt.data);
+        const data = message.snapshot;
+        const history = message.reset ? (data.history || []) : latestHistory.concat(message.history || []);
+        data.history = history.slice(-200);
+        render(data);
+      } catch (err) {
+        console.error('Event error', err);
+      }
+    }
+
     function updateImages(previews) {
       const container = document.getElementById('images');
       container.innerHTML = '';
@@ -500,12 +869,23 @@ _DASHBOARD_HTML = """
       }
     });
 
-    refresh();
-    setInterval(refresh, 100);
+    if (window.EventSource) {
+      // The server pushes history deltas; EventSource reconnects on its own
+      // and the first event after (re)connecting carries the full history.
+      new EventSource('/events').onmessage = onEvent;
+    } else {
+      refresh();
+      setInterval(refresh, 100);
+    }
   </script>
 </body>
 </html>
 """
+_DASHBOARD_HTML_BYTES = _DASHBOARD_HTML.encode("utf-8")
+_DASHBOARD_HTML_GZIP = gzip.compress(_DASHBOARD_HTML_BYTES, mtime=0)
+_DASHBOARD_ETAG = f'"{hashlib.sha1(_DASHBOARD_HTML_BYTES).hexdigest()}"'
+# Each encoding is its own representation, so it gets its own validator.
+_DASHBOARD_GZIP_ETAG = f'{_DASHBOARD_ETAG[:-1]}-gzip"'
 
 
 class CameraSubscriber:
@@ -513,33 +893,60 @@ class CameraSubscriber:
         self._callback = callback
         self._context = zmq.Context.instance()
         self._socket = self._context.socket(zmq.SUB)
+        # Only the newest frame per camera is shown; don't queue up stale JPEGs.
+        # CONFLATE would do this for us but drops multipart (topic, payload)
+        # messages, so _loop keeps the newest payload per topic instead.
+        self._socket.setsockopt(zmq.RCVHWM, 16)
+        self._socket.setsockopt(zmq.LINGER, 0)
         self._socket.connect(f"tcp://{host}:{port}")
         self._socket.setsockopt(zmq.SUBSCRIBE, b"")
         self._stop = threading.Event()
+        # stop() writes here to wake the poller, so _loop can block without a timeout.
+        self._wake_r, self._wake_w = socket.socketpair()
         self._thread = threading.Thread(target=self._loop, daemon=True)
         self._thread.start()
 
     def _loop(self) -> None:
         poller = zmq.Poller()
         poller.register(self._socket, zmq.POLLIN)
+        poller.register(self._wake_r, zmq.POLLIN)
+        sub, wake, callback = self._socket, self._wake_r, self._callback
+        recv_multipart, unpackb = sub.recv_multipart, msgpack.unpackb
         while not self._stop.is_set():
-            events = dict(poller.poll(500))
-            if self._socket in events and events[self._socket] == zmq.POLLIN:
-                try:
-                    topic, payload = self._socket.recv_multipart()
-                except ValueError:
-                    continue
-                try:
-                    data = msgpack.unpackb(payload, raw=False)
-                except Exception:
-                    continue
-                camera = topic.decode("utf-8")
-                try:
-                    self._callback(camera, data)
-                except Exception:
-                    continue
+            events = dict(poller.poll())
+            if wake in events:
+                break
+            if events.get(sub) == zmq.POLLIN:
+                # Drain everything queued and only decode the newest frame per
+                # camera; older ones would be overwritten before anyone saw them.
+                # Frames are received without copying; unpackb reads the ZMQ
+                # buffer directly and only the JPEG bytes get materialized.
+                latest: dict[bytes, zmq.Frame] = {}
+                while True:
+                    try:
+                        parts = recv_multipart(zmq.NOBLOCK, copy=False)
+                    except zmq.Again:
+                        break
+                    if len(parts) == 2:
+                        latest[parts[0].bytes] = parts[1]
+                for topic, frame in latest.items():
+                    try:
+                        data = unpackb(frame.buffer, raw=False)
+                    except Exception:
+                        continue
+                    camera = topic.decode("utf-8")
+                    try:
+                        callback(camera, data)
+                    except Exception:
+                        continue
 
     def stop(self) -> None:
         self._stop.set()
+        try:
+            self._wake_w.send(b"\0")
+        except OSError:
+            pass
         self._thread.join(timeout=1.0)
-        self._socket.close(0)
+        self._socket.close()
+        self._wake_r.close()
+        self._wake_w.close()
@@ -128,7 +128,9 @@ def main(argv: list[str] | None = None) -> None:
         server.close()
         sys.exit(0)
 
-    for sig in (signal.SIGINT, signal.SIGTERM):
+    # Services run in their own sessions and don't see the terminal's SIGHUP,
+    # so the manager must stop them itself when the SSH session drops.
+    for sig in (signal.SIGINT, signal.SIGTERM, signal.SIGHUP):
         signal.signal(sig, shutdown_signal)
 
     print(f"[hub-manager] listening on tcp://{host}:{port} with {len(services)} service(s)")
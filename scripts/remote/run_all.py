@@ -5,11 +5,6 @@ import threading
 import time
 from pathlib import Path
 
-from brainbot_command_service.run_command_service import main as command_main
-from brainbot_control_service.run_robot_service import main as robot_main
-from brainbot_core.config import load_server_config
-from brainbot_core.transport import BaseZMQClient
-
 COMMAND_CONFIG = Path(__file__).with_name("thor_command.yaml")
 ROBOT_CONFIG = Path(__file__).with_name("thor_robot.yaml")
 
@@ -17,6 +12,8 @@ CommandEndpoint = tuple[str, int, str | None]
 
 
 def resolve_command_endpoint(config_path: Path) -> CommandEndpoint:
+    from brainbot_core.config import load_server_config
+
     config = load_server_config(config_path)
     host = config.network.host or "127.0.0.1"
     if host in {"0.0.0.0", "*"}:
@@ -25,26 +22,34 @@ def resolve_command_endpoint(config_path: Path) -> CommandEndpoint:
 
 
 def wait_for_command_service(endpoint: CommandEndpoint, timeout: float, interval: float) -> bool:
+    from brainbot_core.transport import BaseZMQClient
+
     host, port, api_token = endpoint
     poll_delay = max(interval, 0.1)
-    attempt_timeout_ms = max(int(poll_delay * 1000), 1)
     deadline = time.monotonic() + max(timeout, 0.0)
 
-    while True:
-        client = BaseZMQClient(host=host, port=port, timeout_ms=attempt_timeout_ms, api_token=api_token)
-        try:
-            if client.ping():
-                return True
-        except KeyboardInterrupt:
-            raise
-        except Exception:
-            pass
-        finally:
-            client.close()
-
-        if time.monotonic() >= deadline:
-            return False
-        time.sleep(poll_delay)
+    # One REQ socket for the whole wait: ZMQ holds the ping until the service
+    # binds and reconnects by itself, so the blocking recv returns as soon as
+    # the service answers. Only an error reply needs another attempt.
+    client = BaseZMQClient(host=host, port=port, timeout_ms=1, api_token=api_token)
+    try:
+        while True:
+            client.set_timeout(max(int((deadline - time.monotonic()) * 1000), 1))
+            try:
+                if client.ping():
+                    return True
+            except KeyboardInterrupt:
+                raise
+            except TimeoutError:
+                return False
+            except Exception:
+                pass
+
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(min(poll_delay, max(deadline - time.monotonic(), 0.0)))
+    finally:
+        client.close()
 
 
 def run_command(
@@ -52,6 +57,8 @@ def run_command(
     config: Path | None = None,
     extra_args: list[str] | None = None,
 ) -> None:
+    from brainbot_command_service.run_command_service import main as command_main
+
     config_path = config or COMMAND_CONFIG
     argv = ["--config", str(config_path)]
     if log_level:
@@ -62,6 +69,8 @@ def run_command(
 
 
 def run_robot(no_calibrate: bool = False, config: Path | None = None) -> None:
+    from brainbot_control_service.run_robot_service import main as robot_main
+
     config_path = config or ROBOT_CONFIG
     argv = ["--config", str(config_path)]
     if no_calibrate:
@@ -120,6 +129,11 @@ def main(argv: list[str] | None = None) -> None:
     command_thread: threading.Thread | None = None
     try:
         if not args.robot_only:
+            # Load the command stack here on the main thread, so the import in
+            # run_command is a sys.modules lookup rather than a second thread
+            # racing this one for the import lock.
+            import brainbot_command_service.run_command_service  # noqa: F401
+
             command_thread = threading.Thread(
                 target=run_command,
                 args=(args.log_level, args.command_config, extra_args),
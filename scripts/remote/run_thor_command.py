@@ -3,8 +3,6 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-from brainbot_command_service.run_command_service import main as command_main
-
 DEFAULT_CONFIG = Path(__file__).with_name("thor_command.yaml")
 
 
@@ -41,6 +39,9 @@ def main() -> None:
     elif mode_dispatcher != "cli":
         command_argv.extend(["--mode-dispatcher", mode_dispatcher])
 
+    # Imported late so --help and argument errors don't load the service stack.
+    from brainbot_command_service.run_command_service import main as command_main
+
     command_main(command_argv)
 
 
@@ -3,11 +3,6 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-import sys
-
-from brainbot_control_service.run_robot_service import main as robot_main
-
-
 DEFAULT_CONFIG = Path(__file__).with_name("thor_robot.yaml")
 
 
@@ -20,6 +15,9 @@ def main() -> None:
     argv = ["--config", str(args.config)]
     if args.no_calibrate:
         argv.append("--no-calibrate")
+    # Imported late so --help and argument errors don't load the robot stack.
+    from brainbot_control_service.run_robot_service import main as robot_main
+
     robot_main(argv)
 
 
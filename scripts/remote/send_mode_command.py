@@ -4,57 +4,108 @@ import argparse
 import json
 import socket
 from pathlib import Path
+from typing import Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+
+def _build_teleop(args: argparse.Namespace) -> dict:
+    if not args.value:
+        raise SystemExit("teleop requires an alias argument")
+    return {"teleop": args.value}
+
+
+def _build_infer(args: argparse.Namespace) -> dict:
+    if not args.value:
+        raise SystemExit("infer requires an instruction argument")
+    return {"infer": args.value}
+
+
+def _build_idle(args: argparse.Namespace) -> dict:
+    return {"idle": args.value or ""}
+
+
+def _build_shutdown(args: argparse.Namespace) -> dict:
+    return {"shutdown": args.value or ""}
+
+
+def _build_data(args: argparse.Namespace) -> dict:
+    payload: dict[str, object]
+    if args.mode or args.value:
+        payload = {"data": {}}
+        if args.mode:
+            payload["data"]["mode"] = args.mode
+        if args.value:
+            payload["data"]["command"] = args.value
+        if not payload["data"]:
+            payload["data"] = ""
+        return payload
+    return {"data": ""}
+
+
+def _build_raw(args: argparse.Namespace) -> dict:
+    if not args.value:
+        raise SystemExit("raw command requires a JSON payload")
+    try:
+        parsed = json.loads(args.value)
+    except json.JSONDecodeError as exc:
+        raise SystemExit(f"invalid JSON for raw command: {exc}")
+    if not isinstance(parsed, dict):
+        raise SystemExit("raw command must be a JSON object")
+    return parsed
+
+
+_BUILDERS: dict[str, Callable[[argparse.Namespace], dict]] = {
+    "teleop": _build_teleop,
+    "infer": _build_infer,
+    "idle": _build_idle,
+    "shutdown": _build_shutdown,
+    "data": _build_data,
+    "raw": _build_raw,
+}
 
 
 def build_payload(args: argparse.Namespace) -> dict:
-    match args.command:
-        case "teleop":
-            if not args.value:
-                raise SystemExit("teleop requires an alias argument")
-            return {"teleop": args.value}
-        case "infer":
-            if not args.value:
-                raise SystemExit("infer requires an instruction argument")
-            return {"infer": args.value}
-        case "idle":
-            return {"idle": args.value or ""}
-        case "shutdown":
-            return {"shutdown": args.value or ""}
-        case "data":
-            payload: dict[str, object]
-            if args.mode or args.value:
-                payload = {"data": {}}
-                if args.mode:
-                    payload["data"]["mode"] = args.mode
-                if args.value:
-                    payload["data"]["command"] = args.value
-                if not payload["data"]:
-                    payload["data"] = ""
-                return payload
-            return {"data": ""}
-        case "raw":
-            if not args.value:
-                raise SystemExit("raw command requires a JSON payload")
-            try:
-                parsed = json.loads(args.value)
-            except json.JSONDecodeError as exc:
-                raise SystemExit(f"invalid JSON for raw command: {exc}")
-            if not isinstance(parsed, dict):
-                raise SystemExit("raw command must be a JSON object")
-            return parsed
-        case _:
-            raise SystemExit(f"unsupported command: {args.command}")
+    builder = _BUILDERS.get(args.command)
+    if builder is None:
+        raise SystemExit(f"unsupported command: {args.command}")
+    return builder(args)
+
+
+def _encode_line(payload: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload) + b"\n"
+    return (json.dumps(payload) + "\n").encode("utf-8")
 
 
 def send(socket_path: Path, payload: dict, timeout: float | None = 2.0) -> str:
-    message = json.dumps(payload) + "\n"
+    responses = send_many(socket_path, [payload], timeout=timeout)
+    return responses[0] if responses else ""
+
+
+def send_many(socket_path: Path, payloads: list[dict], timeout: float | None = 2.0) -> list[str]:
+    """Send ``payloads`` over one connection and return one response per command.
+
+    The list is shorter than ``payloads`` if the dispatcher closes the
+    connection early (it does so after a command raises).
+    """
+    message = b"".join(_encode_line(payload) for payload in payloads)
+    responses: list[str] = []
     with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
         if timeout is not None:
             client.settimeout(timeout)
         client.connect(str(socket_path))
-        client.sendall(message.encode("utf-8"))
-        response = client.recv(1024)
-    return response.decode("utf-8", errors="replace").strip()
+        client.sendall(message)
+        with client.makefile("rb") as reader:
+            for _ in payloads:
+                line = reader.readline()
+                if not line:
+                    break
+                responses.append(line.decode("utf-8", errors="replace").strip())
+    return responses
 
 
 def main(argv: list[str] | None = None) -> None:
@@ -65,7 +116,7 @@ def main(argv: list[str] | None = None) -> None:
         default=Path("/tmp/brainbot_modesock"),
         help="Path to the UNIX socket exposed by the command service",
     )
-    parser.add_argument("command", choices=("teleop", "infer", "idle", "shutdown", "data", "raw"))
+    parser.add_argument("command", choices=tuple(_BUILDERS))
     parser.add_argument("value", nargs="?", help="Command argument (alias, instruction, reason, etc.)")
     parser.add_argument("--mode", help="Target mode when sending a data command")
     parser.add_argument("--timeout", type=float, default=2.0, help="Socket timeout in seconds (default: 2.0)")
@@ -73,7 +124,10 @@ def main(argv: list[str] | None = None) -> None:
     args = parser.parse_args(argv)
 
     payload = build_payload(args)
-    response = send(args.socket, payload, timeout=args.timeout)
+    try:
+        response = send(args.socket, payload, timeout=args.timeout)
+    except OSError as exc:
+        raise SystemExit(f"could not send command over {args.socket}: {exc}")
     print(response or "(no response)")
 
 